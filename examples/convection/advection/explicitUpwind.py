@@ -51,7 +51,7 @@ steps = 1000
 
 mesh = Grid1D(dx = dx, nx = nx)
 
-startingArray = zeros(nx, 'd')
+startingArray = numerix.zeros(nx, 'd')
 startingArray[50:90] = 1. 
 
 var = CellVariable(
@@ -67,10 +67,11 @@ eq = TransientTerm() - ExplicitUpwindConvectionTerm(coeff=(velocity,))
 if __name__ == '__main__':
     
     viewer = Viewer(vars=(var,))
+    solver = LinearLUSolver(tolerance=1.e-15, iterations=2000)
     for step in range(steps):
         eq.solve(var,
                  dt = timeStepDuration,
-                 solver = LinearLUSolver(tolerance=1.e-15, iterations=2000))
+                 solver = solver)
         viewer.plot()
     viewer.plot()
     raw_input('finished')
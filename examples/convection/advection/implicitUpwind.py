@@ -51,7 +51,7 @@ steps = 1000
 
 mesh = Grid1D(dx = dx, nx = nx)
 
-startingArray = zeros(nx, 'd')
+startingArray = numerix.zeros(nx, 'd')
 startingArray[50:90] = 1. 
 
 var = CellVariable(
@@ -69,10 +69,11 @@ if __name__ == '__main__':
     viewer = Viewer(vars=(var,))
     viewer.plot()
     raw_input("press key to continue")
+    solver = LinearLUSolver(tolerance = 1.e-15)
     for step in range(steps):
         eq.solve(var,
                  dt = timeStepDuration,
-                 solver = LinearLUSolver(tolerance = 1.e-15))
+                 solver = solver)
         viewer.plot()
     viewer.plot()
     raw_input('finished')
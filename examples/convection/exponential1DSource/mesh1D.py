@@ -99,14 +99,15 @@ and test the solution against the analytical result:
    
 or
 
-.. index:: exp
+.. index:: expm1
 
 >>> axis = 0
 >>> x = mesh.cellCenters[axis]
 >>> AA = -sourceCoeff * x / convCoeff[axis]
 >>> BB = 1. + sourceCoeff * L / convCoeff[axis]
->>> CC = 1. - numerix.exp(-convCoeff[axis] * x / diffCoeff)
->>> DD = 1. - numerix.exp(-convCoeff[axis] * L / diffCoeff)
+>>> ratio = convCoeff[axis] / diffCoeff
+>>> CC = -numerix.expm1(-ratio * x)
+>>> DD = -numerix.expm1(-ratio * L)
 >>> analyticalArray = AA + BB * CC / DD
 >>> print var.allclose(analyticalArray, rtol=1e-4, atol=1e-4)
 1
@@ -81,8 +81,9 @@ The analytical solution test for this problem is given by:
 >>> y = mesh.cellCenters[axis]
 >>> AA = -sourceCoeff * y / convCoeff[axis]
 >>> BB = 1. + sourceCoeff * L / convCoeff[axis]
->>> CC = 1. - numerix.exp(-convCoeff[axis] * y / diffCoeff)
->>> DD = 1. - numerix.exp(-convCoeff[axis] * L / diffCoeff)
+>>> ratio = convCoeff[axis] / diffCoeff
+>>> CC = -numerix.expm1(-ratio * y)
+>>> DD = -numerix.expm1(-ratio * L)
 >>> analyticalArray = AA + BB * CC / DD
 >>> print var.allclose(analyticalArray, atol = 1e-5) 
 1
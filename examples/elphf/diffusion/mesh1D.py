@@ -156,16 +156,7 @@ True
 __docformat__ = 'restructuredtext'
 
 if __name__ == '__main__':
-    ## from fipy.tools.profiler.profiler import Profiler
-    ## from fipy.tools.profiler.profiler import calibrate_profiler
-
-    # fudge = calibrate_profiler(10000)
-    # profile = Profiler('profile', fudge=fudge)
-
     import fipy.tests.doctestPlus
     exec(fipy.tests.doctestPlus._getScript())
     
-    # profile.stop()
-	    
     raw_input("finished")
-
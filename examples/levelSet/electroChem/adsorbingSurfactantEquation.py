@@ -266,6 +266,11 @@ class AdsorbingSurfactantEquation():
 
         self.dt = Variable(0.)
         mesh = distanceVar.mesh
+
+        ## constrain once here rather than on every `solve()` or `sweep()`,
+        ## which would keep appending to the variable's constraints
+        surfactantVar.constrain(0, mesh.exteriorFaces)
+
         adsorptionCoeff = self.dt * bulkVar * rateConstant
         spCoeff = adsorptionCoeff * distanceVar._cellInterfaceFlag
         scCoeff = adsorptionCoeff * distanceVar.cellInterfaceAreas / mesh.cellVolumes
@@ -323,8 +328,6 @@ class AdsorbingSurfactantEquation():
         if type(boundaryConditions) not in (type(()), type([])):
             boundaryConditions = (boundaryConditions,)
         
-        var.constrain(0, var.mesh.exteriorFaces)
-        
         self.eq.solve(var,
                       boundaryConditions=boundaryConditions,
                       solver = solver,
@@ -352,8 +355,6 @@ class AdsorbingSurfactantEquation():
         
         if type(boundaryConditions) not in (type(()), type([])):
             boundaryConditions = (boundaryConditions,)
-        
-        var.constrain(0, var.mesh.exteriorFaces)
 
         return self.eq.sweep(var, solver=solver, boundaryConditions=boundaryConditions, underRelaxation=underRelaxation, residualFn=residualFn, dt=1.)
 
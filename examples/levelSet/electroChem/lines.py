@@ -173,11 +173,15 @@ def _getOrderedLines(IDs, coordinates, thresholdDistance = 0.0):
     closeIDs = numerix.zeros((len(IDs), len(IDs)), 'l')
     vertices = []
     for ID in IDs:
-        distances = numerix.zeros(len(IDs), 'd')
-        for i in range(len(coordinates[0,:])):
-            distances += (coordinates[:,i] - coordinates[ID,i])**2
         vertices.append(_Vertex(ID, coordinates[ID, 0], coordinates[ID, 1]))
-        closeIDs[ID,:] = numerix.argsort(distances)
+
+    ## squared distances between every pair of vertices, one coordinate
+    ## column at a time
+    distances = numerix.zeros((len(IDs), len(IDs)), 'd')
+    for component in coordinates.swapaxes(0, 1):
+        distances += (component[numerix.newaxis, :] - component[:, numerix.newaxis])**2
+    rows = numerix.array(IDs, 'l')
+    closeIDs[rows, :] = numerix.argsort(distances[rows, :], axis=-1)
 
 
     for ID in IDs:
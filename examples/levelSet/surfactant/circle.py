@@ -138,14 +138,9 @@ if __name__ == '__main__':
     answer = initialSurfactantValue * initialRadius / (initialRadius +  distanceToTravel)
     coverage = surfactantVariable * mesh.cellVolumes / areas
 
-    error = 0.
-    size = 0
-    for i in range(len(coverage)):
-        if coverage[i] > 1e-3:
-            error += (coverage[i] / answer - 1.)**2
-            size += 1
-            
-    error = numerix.sqrt(error / size)
+    covered = coverage > 1e-3
+    error = (coverage / answer - 1.)**2 * covered
+    error = numerix.sqrt(numerix.sum(error) / numerix.sum(covered))
     
     print 'error:', error
     
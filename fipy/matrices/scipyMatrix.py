@@ -59,6 +59,58 @@ class _ScipyMatrix(_SparseMatrix):
         """
         self.matrix = matrix
 
+    def _getMatrix(self):
+        if self._staged:
+            self._addStaged()
+        return self._matrix
+        
+    def _setMatrix(self, matrix):
+        self._matrix = matrix
+        self._staged = []
+        
+    def _delMatrix(self):
+        del self._matrix
+        self._staged = []
+        
+    matrix = property(_getMatrix, _setMatrix, _delMatrix)
+    
+    def _addStaged(self):
+        """
+        Add all the (`vector`, `id1`, `id2`) triplets collected by `addAt()`
+        to the matrix at once, as a single CSR matrix with duplicate entries
+        summed.
+
+            >>> L = _ScipyMatrixFromShape(size=3)
+            >>> L.addAt([1., 2.], [0, 1], [0, 1])
+            >>> L.addAt([3., 4.], [0, 2], [0, 1])
+            >>> len(L._staged)
+            2
+            >>> print L
+             4.000000      ---        ---    
+                ---     2.000000      ---    
+                ---     4.000000      ---    
+            >>> len(L._staged)
+            0
+        """
+        vectors, id1s, id2s = zip(*self._staged)
+        self._staged = []
+        
+        vector = numerix.concatenate(vectors)
+        id1 = numerix.concatenate(id1s)
+        id2 = numerix.concatenate(id2s)
+
+        ## a stable sort on the row alone replaces the two-key lexsort
+        ## `coo_matrix.tocsr()` uses to find duplicates
+        order = numerix.argsort(id1, kind='mergesort')
+        indptr = numerix.concatenate(([0], numerix.cumsum(numerix.bincount(id1, minlength=self._matrix.shape[0]))))
+        temp = sp.csr_matrix((vector[order], id2[order], indptr), self._matrix.shape)
+        temp.sum_duplicates()
+        
+        if self._matrix.nnz == 0:
+            self._matrix = temp
+        else:
+            self._matrix = self._matrix + temp
+
     def getCoupledClass(self):
         return _CoupledScipyMeshMatrix
     
@@ -186,7 +238,7 @@ class _ScipyMatrix(_SparseMatrix):
 
     @property
     def _shape(self):
-        return self.matrix.shape
+        return self._matrix.shape
 
     @property
     def _range(self):
@@ -252,9 +304,11 @@ class _ScipyMatrix(_SparseMatrix):
         """
         assert(len(id1) == len(id2) == len(vector))
 
-        temp = sp.csr_matrix((vector, (id1, id2)), self.matrix.shape)
-
-        self.matrix = self.matrix + temp
+        ## stage copies of the entries; they are converted and added in one
+        ## go the next time the matrix itself is needed
+        self._staged.append((numerix.array(vector, 'd').ravel(),
+                             numerix.array(id1, 'l').ravel(),
+                             numerix.array(id2, 'l').ravel()))
 
     def addAtDiagonal(self, vector):
         if type(vector) in [type(1), type(1.)]:
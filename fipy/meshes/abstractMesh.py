@@ -525,6 +525,19 @@ class AbstractMesh(object):
             self._interiorFaceCellIDs = numerix.take(self.faceCellIDs,
                                                      self.interiorFaceIDs, axis=1)
         return self._interiorFaceCellIDs
+
+    @property
+    def _interiorAdjacentCellIDs(self):
+        """
+        The `_adjacentCellIDs` of the interior faces. The sparsity pattern
+        of every face term is built from these, so they are only
+        calculated once per mesh.
+        """
+        if not hasattr(self, '_interiorAdjacentCellIDs_'):
+            id1, id2 = self._adjacentCellIDs
+            self._interiorAdjacentCellIDs_ = (numerix.take(id1, self.interiorFaceIDs),
+                                              numerix.take(id2, self.interiorFaceIDs))
+        return self._interiorAdjacentCellIDs_
          
     @property
     def _numberOfFacesPerCell(self):
@@ -82,7 +82,7 @@ class LinearJORSolver(PysparseSolver):
 
             x[:] = xold + self.relaxation * (x - xold)  
 
-            tol = max(abs(residual))
+            tol = abs(residual).max()
 
             print iteration,tol
 
@@ -79,7 +79,7 @@ class LinearLUSolver(PysparseSolver):
 
     def _solve_(self, L, x, b):
         diag = L.takeDiagonal()
-        maxdiag = max(numerix.absolute(diag))
+        maxdiag = numerix.absolute(diag).max()
 
         L = L * (1 / maxdiag)
         b = b * (1 / maxdiag)
@@ -3,6 +3,7 @@ from fipy.solvers.scipy.linearGMRESSolver import *
 from fipy.solvers.scipy.linearBicgstabSolver import *
 from fipy.solvers.scipy.linearLUSolver import *
 from fipy.solvers.scipy.linearPCGSolver import *
+from fipy.solvers.scipy.preconditioners import *
 
 DefaultSolver = LinearLUSolver
 DummySolver = LinearGMRESSolver
@@ -19,3 +20,4 @@ __all__.extend(linearGMRESSolver.__all__)
 __all__.extend(linearBicgstabSolver.__all__)
 __all__.extend(linearLUSolver.__all__)
 __all__.extend(linearPCGSolver.__all__)
+__all__.extend(preconditioners.__all__)
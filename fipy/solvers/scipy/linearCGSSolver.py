@@ -37,16 +37,17 @@ __docformat__ = 'restructuredtext'
 from scipy.sparse.linalg import cgs
 
 from fipy.solvers.scipy.scipyKrylovSolver import _ScipyKrylovSolver
+from fipy.solvers.scipy.preconditioners.jacobiPreconditioner import JacobiPreconditioner
 
 __all__ = ["LinearCGSSolver"]
 
 class LinearCGSSolver(_ScipyKrylovSolver):
     """
     The `LinearCGSSolver` is an interface to the CGS solver in Scipy,
-    with no preconditioning by default.
+    using the `JacobiPreconditioner` by default.
     """
 
-    def __init__(self, tolerance=1e-15, iterations=2000, precon=None):
+    def __init__(self, tolerance=1e-15, iterations=2000, precon=JacobiPreconditioner()):
         """
         :Parameters:
           - `tolerance`: The required error tolerance.
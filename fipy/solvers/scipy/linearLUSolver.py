@@ -34,9 +34,11 @@
 
 __docformat__ = 'restructuredtext'
 
+import hashlib
 import os
 
 from scipy.sparse.linalg import splu
+from scipy.linalg import get_blas_funcs
 
 from fipy.solvers.scipy.scipySolver import _ScipySolver
 from fipy.tools import numerix
@@ -48,35 +50,103 @@ class LinearLUSolver(_ScipySolver):
     The `LinearLUSolver` solves a linear system of equations using
     LU-factorisation.  The `LinearLUSolver` is a wrapper class for the
     the Scipy `scipy.sparse.linalg.splu` moduleq.
+
+    Successive solves of an unchanged matrix share one factorization.
+
+        >>> from fipy import Grid1D, CellVariable, TransientTerm, DiffusionTerm
+        >>> mesh = Grid1D(nx=10)
+        >>> var = CellVariable(mesh=mesh, value=mesh.cellCenters[0])
+        >>> D = CellVariable(mesh=mesh, value=1.)
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=D)
+        >>> solver = LinearLUSolver()
+        >>> eq.solve(var, dt=1., solver=solver)
+        >>> LU = solver._LU
+        >>> eq.solve(var, dt=1., solver=solver)
+        >>> solver._LU is LU
+        True
+        >>> D.value = 2.
+        >>> eq.solve(var, dt=1., solver=solver)
+        >>> solver._LU is LU
+        False
     """
     
+    def _factorize(self, A):
+        """
+        Return the LU decomposition of `A`, reusing the previous
+        factorization if `A` has not changed since the last solve, as is
+        the case for time steps of a linear equation with constant
+        coefficients. Only a digest of the factorized matrix is kept, not
+        the matrix itself.
+
+            >>> import scipy.sparse as sp
+            >>> solver = LinearLUSolver()
+            >>> A = sp.csc_matrix(numerix.array(((4., 1., 0.), 
+            ...                                  (1., 4., 1.), 
+            ...                                  (0., 1., 4.))))
+            >>> LU = solver._factorize(A)
+            >>> solver._factorize(A.copy()) is LU
+            True
+            >>> B = A.copy()
+            >>> B[1, 1] = 5.
+            >>> LU2 = solver._factorize(B)
+            >>> LU2 is LU
+            False
+            >>> print numerix.allclose(LU2.solve(B * numerix.array((1., 2., 3.))), (1., 2., 3.))
+            True
+            >>> solver._factorize(A) is LU2
+            False
+        """
+        fingerprint = (A.shape, A.dtype, A.nnz, self._digest(A))
+        
+        if fingerprint != getattr(self, '_factorized', None):
+            self._LU = splu(A, diag_pivot_thresh=1.,
+                               drop_tol=0.,
+                               relax=1,
+                               panel_size=10,
+                               permc_spec=3)
+            self._factorized = fingerprint
+        
+        return self._LU
+
+    @staticmethod
+    def _digest(A):
+        digest = hashlib.sha1()
+        for a in (A.indptr, A.indices, A.data):
+            digest.update(numerix.ascontiguousarray(a))
+        return digest.digest()
+
     def _solve_(self, L, x, b):
         diag = L.takeDiagonal()
-        maxdiag = max(numerix.absolute(diag))
+        maxdiag = numerix.absolute(diag).max()
 
         L = L * (1 / maxdiag)
         b = b * (1 / maxdiag)
 
-        LU = splu(L.matrix.asformat("csc"), diag_pivot_thresh=1.,
-                                            drop_tol=0.,
-                                            relax=1,
-                                            panel_size=10,
-                                            permc_spec=3)
+        LU = self._factorize(L.matrix.asformat("csc"))
+
+        axpy, nrm2 = get_blas_funcs(('axpy', 'nrm2'), (b,))
 
-        error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
+        error0 = nrm2(L * x - b)
 
         for iteration in range(min(self.iterations, 10)):
             errorVector = L * x - b
 
-            if (numerix.sqrt(numerix.sum(errorVector**2)) / error0)  <= self.tolerance:
+            if nrm2(errorVector) <= self.tolerance * error0:
                 break
 
             xError = LU.solve(errorVector)
-            x[:] = x - xError
+            x[:] = axpy(xError, x, a=-1.)
             
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT        
             PRINT('iterations: %d / %d' % (iteration+1, self.iterations))
-            PRINT('residual:', numerix.sqrt(numerix.sum(errorVector**2)))
+            PRINT('residual:', nrm2(errorVector))
 
         return x
+
+def _test(): 
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+    
+if __name__ == "__main__": 
+    _test() 
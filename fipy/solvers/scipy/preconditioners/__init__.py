@@ -0,0 +1,6 @@
+from fipy.solvers.scipy.preconditioners.jacobiPreconditioner import *
+from fipy.solvers.scipy.preconditioners.iluPreconditioner import *
+
+__all__ = []
+__all__.extend(jacobiPreconditioner.__all__)
+__all__.extend(iluPreconditioner.__all__)
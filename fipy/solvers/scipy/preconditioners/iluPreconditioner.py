@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ # 
+ #  FILE: "iluPreconditioner.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #  
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental 
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ # 
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  
+ # ###################################################################
+ ##
+
+
+from scipy.sparse.linalg import LinearOperator, spilu
+
+from fipy.tools import numerix
+
+__all__ = ["ILUPreconditioner"]
+
+class ILUPreconditioner():
+    """
+    Incomplete LU preconditioner for the Scipy Krylov solvers, using
+    `scipy.sparse.linalg.spilu`.
+
+        >>> import scipy.sparse as sp
+        >>> A = sp.csr_matrix(numerix.array(((4., 1., 0.), 
+        ...                                  (1., 4., 1.), 
+        ...                                  (0., 1., 4.))))
+        >>> M = ILUPreconditioner(dropTolerance=0.)._applyToMatrix(A)
+        >>> print numerix.allclose(M.matvec(A * numerix.array((1., 2., 3.))), (1., 2., 3.))
+        True
+
+    It is passed to any of the Scipy Krylov solvers through their
+    `precon` argument.
+
+        >>> from fipy import Grid1D, CellVariable, DiffusionTerm
+        >>> from fipy.solvers.scipy import LinearGMRESSolver
+        >>> mesh = Grid1D(nx=50, dx=0.02)
+        >>> var = CellVariable(mesh=mesh)
+        >>> var.constrain(0., mesh.facesLeft)
+        >>> var.constrain(1., mesh.facesRight)
+        >>> DiffusionTerm().solve(var, 
+        ...     solver=LinearGMRESSolver(tolerance=1e-10, precon=ILUPreconditioner()))
+        >>> print numerix.allclose(var, mesh.cellCenters[0], atol=1e-8)
+        True
+    """
+    def __init__(self, dropTolerance=1e-4, fillFactor=10):
+        """
+        :Parameters:
+          - `dropTolerance`: Drop tolerance for the incomplete factorization.
+          - `fillFactor`: Upper bound on the fill ratio of the factors.
+        """
+        self.dropTolerance = dropTolerance
+        self.fillFactor = fillFactor
+        
+    def _applyToMatrix(self, A):
+        ILU = spilu(A.asformat("csc"), drop_tol=self.dropTolerance, fill_factor=self.fillFactor)
+        
+        return LinearOperator(A.shape, matvec=ILU.solve, dtype=A.dtype)
+
+def _test(): 
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+    
+if __name__ == "__main__": 
+    _test() 
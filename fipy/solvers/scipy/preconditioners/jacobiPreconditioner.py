@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ # 
+ #  FILE: "jacobiPreconditioner.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #  
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental 
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ # 
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  
+ # ###################################################################
+ ##
+
+from scipy.sparse.linalg import LinearOperator
+
+from fipy.tools import numerix
+
+__all__ = ["JacobiPreconditioner"]
+
+class JacobiPreconditioner():
+    """
+    Diagonal (Jacobi) preconditioner for the Scipy Krylov solvers.
+
+    Applying the preconditioner is a single element-wise multiplication by
+    the inverse of the matrix diagonal, which is computed once per solve.
+
+        >>> import scipy.sparse as sp
+        >>> A = sp.csr_matrix(numerix.array(((4., 1.), (1., 2.))))
+        >>> M = JacobiPreconditioner()._applyToMatrix(A)
+        >>> print numerix.allclose(M.matvec(numerix.array((4., 2.))), (1., 1.))
+        True
+    """
+    def __init__(self):
+        pass
+        
+    def _applyToMatrix(self, A):
+        diag = A.diagonal()
+        diag[diag == 0] = 1.
+        inverseDiag = 1. / diag
+        
+        return LinearOperator(A.shape, matvec=lambda x: inverseDiag * x, dtype=inverseDiag.dtype)
+
+def _test(): 
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+    
+if __name__ == "__main__": 
+    _test() 
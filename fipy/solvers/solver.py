@@ -122,6 +122,15 @@ class Solver(object):
         self.matrix = matrix
         self.RHSvector = RHSvector
 
+    def _releaseMatrix(self):
+        """
+        Drop the references to a previously stored system, so that it can be
+        freed before the next one is assembled.
+        """
+        self.var = None
+        self.matrix = None
+        self.RHSvector = None
+
     def _solve(self):
         raise NotImplementedError
         
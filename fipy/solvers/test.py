@@ -34,12 +34,20 @@
 
 __all__ = []
 
-from fipy.tests.lateImportTest import _LateImportTestSuite
+from fipy.tests.doctestPlus import _LateImportDocTestSuite
 import fipy.tests.testProgram
 
 def _suite():
-    return _LateImportTestSuite(testModuleNames = (), 
-                                base = __name__)
+    from fipy.solvers import solver
+    
+    docTestModuleNames = ()
+    if solver == 'scipy':
+        docTestModuleNames += ('scipy.linearLUSolver',
+                               'scipy.preconditioners.jacobiPreconditioner',
+                               'scipy.preconditioners.iluPreconditioner')
+                               
+    return _LateImportDocTestSuite(docTestModuleNames = docTestModuleNames, 
+                                   base = __name__)
     
 if __name__ == '__main__':
     fipy.tests.testProgram.main(defaultTest='_suite')
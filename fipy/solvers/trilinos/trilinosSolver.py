@@ -61,6 +61,11 @@ class TrilinosSolver(Solver):
         else:
             self.matrix = matrix
         self.RHSvector = RHSvector
+
+    def _releaseMatrix(self):
+        ## the stored matrix object is reused by `_storeMatrix()` and its
+        ## contents are already flushed after every solution
+        pass
         
     @getsetDeprecated
     def _getGlobalMatrixAndVectors(self):
@@ -1,3 +1,5 @@
+import os
+
 class ExplicitVariableError(Exception):
     def __init__(self, s='Terms with explicit Variables cannot mix with Terms with implicit Variables.'):
         Exception.__init__(self, s)
@@ -30,6 +32,11 @@ class TransientTermError(Exception):
     def __init__(self, s='The equation requires a TransientTerm with explicit convection.'):
         Exception.__init__(self, s)
 
+## looked up once rather than on every matrix assembly
+_displayMatrices = 'FIPY_DISPLAY_MATRIX' in os.environ
+_displayTermMatrices = (_displayMatrices
+                        and "terms" in os.environ['FIPY_DISPLAY_MATRIX'].lower().split())
+
 from fipy.terms.transientTerm import *
 from fipy.terms.diffusionTerm import *
 from fipy.terms.explicitDiffusionTerm import *
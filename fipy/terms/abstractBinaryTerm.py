@@ -107,6 +107,14 @@ class _AbstractBinaryTerm(Term):
     def _checkVar(self, var):
         self.term._checkVar(var)
         self.other._checkVar(var)
+
+    def reuseMatrix(self):
+        self.term.reuseMatrix()
+        self.other.reuseMatrix()
+
+    def invalidateMatrixCache(self):
+        self.term.invalidateMatrixCache()
+        self.other.invalidateMatrixCache()
     
 
 from fipy.terms.nonDiffusionTerm import _NonDiffusionTerm
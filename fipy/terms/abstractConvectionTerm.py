@@ -102,8 +102,6 @@ class _AbstractConvectionTerm(FaceTerm):
         if self.__class__ is _AbstractConvectionTerm:
             raise AbstractBaseClassError
             
-        self.stencil = None
-        
         if isinstance(coeff, _MeshVariable) and coeff.rank < 1:
             raise VectorCoeffError
 
@@ -112,6 +110,31 @@ class _AbstractConvectionTerm(FaceTerm):
 
         FaceTerm.__init__(self, coeff=coeff, var=var)
         
+    def _resetGeomCoeff(self):
+        r"""
+        The upwinding stencil and the constraint contributions depend on
+        the coefficient, so they are rebuilt when it is reassigned.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=4)
+        >>> v = CellVariable(mesh=m, value=m.cellCenters[0])
+        >>> v.constrain(1., m.facesLeft)
+        >>> t = UpwindConvectionTerm(coeff=(1.,))
+        >>> (TransientTerm() + t).solve(v, dt=1.)
+        >>> t.coeff = (-1.,)
+        >>> v1 = CellVariable(mesh=m, value=v)
+        >>> v1.constrain(1., m.facesLeft)
+        >>> (TransientTerm() + t).solve(v, dt=1.)
+        >>> (TransientTerm() + UpwindConvectionTerm(coeff=(-1.,))).solve(v1, dt=1.)
+        >>> print numerix.allclose(v, v1)
+        True
+        """
+        FaceTerm._resetGeomCoeff(self)
+        self.stencil = None
+        for attr in ('constraintL', 'constraintB'):
+            if hasattr(self, attr):
+                delattr(self, attr)
+
     def _calcGeomCoeff(self, var):
         mesh = var.mesh
 
@@ -36,12 +36,11 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
-import os
-
 from fipy.terms.unaryTerm import _UnaryTerm
 from fipy.tools import numerix
 from fipy.terms import TermMultiplyError
 from fipy.terms import AbstractBaseClassError
+from fipy.terms import _displayMatrices
 from fipy.variables.faceVariable import FaceVariable
 
 class _AbstractDiffusionTerm(_UnaryTerm):
@@ -50,12 +49,40 @@ class _AbstractDiffusionTerm(_UnaryTerm):
         if self.__class__ is _AbstractDiffusionTerm:
             raise AbstractBaseClassError
         
+        _UnaryTerm.__init__(self, coeff=coeff, var=var)
+        
+    def _resetGeomCoeff(self):
+        r"""
+        The order, the leading coefficient and the lower order term are all
+        derived from the coefficient, so they are rebuilt (along with the
+        coefficient matrices and constraint contributions) when it is
+        reassigned.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=4)
+        >>> v = CellVariable(mesh=m)
+        >>> v.constrain(0., m.facesLeft)
+        >>> t = DiffusionTerm(coeff=1.)
+        >>> t.cacheMatrix()
+        >>> t.solve(v)
+        >>> print numerix.allclose(t.matrix.numpyArray.diagonal(), (-3, -2, -2, -1))
+        True
+        >>> t.coeff = 3.
+        >>> t.solve(v)
+        >>> print numerix.allclose(t.matrix.numpyArray.diagonal(), (-9, -6, -6, -3))
+        True
+        >>> t.coeff = (1., 1.)
+        >>> print t.order
+        4
+        """
+        _UnaryTerm._resetGeomCoeff(self)
+        
+        coeff = self._coeff
         if type(coeff) not in (type(()), type([])):
-            coeff = [coeff]
+            coeff = self._coeff = [coeff]
 
         self.order = len(coeff) * 2
 
-
         if len(coeff) > 0:
             self.nthCoeff = coeff[0]
 
@@ -70,13 +97,19 @@ class _AbstractDiffusionTerm(_UnaryTerm):
         else:
             self.nthCoeff = None
 
-        _UnaryTerm.__init__(self, coeff=coeff, var=var)
-        
         if self.order > 0:
             self.lowerOrderDiffusionTerm = self.__class__(coeff = coeff[1:])
+            
+        for attr in ('coeffDict', 'constraintL', 'constraintB', 'anisotropySource'):
+            if hasattr(self, attr):
+                delattr(self, attr)
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
+            if other == 1:
+                return self
+            elif other == -1:
+                return -self
             self.coeff[0] = other * self.coeff[0] 
             return self.__class__(coeff=self.coeff, var=self.var)
         else:
@@ -208,11 +241,8 @@ class _AbstractDiffusionTerm(_UnaryTerm):
     def __getCoefficientMatrix(self, SparseMatrix, var, coeff):
         mesh = var.mesh
 
-        id1, id2 = mesh._adjacentCellIDs
-        interiorFaces = numerix.nonzero(mesh.interiorFaces)[0]
-    
-        id1 = numerix.take(id1, interiorFaces)
-        id2 = numerix.take(id2, interiorFaces)
+        id1, id2 = mesh._interiorAdjacentCellIDs
+        interiorFaces = mesh.interiorFaceIDs
 
         id1 = self._reshapeIDs(var, id1)
         id2 = self._reshapeIDs(var, id2)
@@ -222,10 +252,14 @@ class _AbstractDiffusionTerm(_UnaryTerm):
 
         coefficientMatrix = SparseMatrix(mesh=mesh, bandwidth = mesh._maxFacesPerCell + 1)
         interiorCoeff = numerix.take(coeff, interiorFaces, axis=-1).ravel()
-        coefficientMatrix.addAt(interiorCoeff, id1.ravel(), id1.swapaxes(0,1).ravel())
-        coefficientMatrix.addAt(-interiorCoeff, id1.ravel(), id2.swapaxes(0,1).ravel())
-        coefficientMatrix.addAt(-interiorCoeff, id2.ravel(), id1.swapaxes(0,1).ravel())
-        coefficientMatrix.addAt(interiorCoeff, id2.ravel(), id2.swapaxes(0,1).ravel())
+
+        ## the diagonal and off-diagonal contributions of every interior
+        ## face are inserted together, so the matrix is only assembled once
+        rows1, rows2 = id1.ravel(), id2.ravel()
+        cols1, cols2 = id1.swapaxes(0,1).ravel(), id2.swapaxes(0,1).ravel()
+        coefficientMatrix.addAt(numerix.concatenate((interiorCoeff, -interiorCoeff, -interiorCoeff, interiorCoeff)),
+                                numerix.concatenate((rows1, rows1, rows2, rows2)),
+                                numerix.concatenate((cols1, cols2, cols1, cols2)))
 
 ##         print 'coefficientMatrix',coefficientMatrix
 ##         raw_input('stopped')
@@ -269,7 +303,7 @@ class _AbstractDiffusionTerm(_UnaryTerm):
     def __doBCs(self, SparseMatrix, higherOrderBCs, N, M, coeffs, coefficientMatrix, boundaryB):
         for boundaryCondition in higherOrderBCs:
             LL, bb = boundaryCondition._buildMatrix(SparseMatrix, N, M, coeffs)
-            if 'FIPY_DISPLAY_MATRIX' in os.environ:
+            if _displayMatrices:
                 self._viewer.title = r"%s %s" % (boundaryCondition.__class__.__name__, self.__class__.__name__)
                 self._viewer.plot(matrix=LL, RHSvector=bb)
                 from fipy import raw_input
@@ -453,6 +487,18 @@ class _AbstractDiffusionTerm(_UnaryTerm):
             
         return (var, L, b)
 
+    def _getMatrixCoeffs(self, var):
+        coeffs = _UnaryTerm._getMatrixCoeffs(self, var)
+        
+        ## the anisotropic source depends on the gradient of `var`
+        if hasattr(self, 'anisotropySource'):
+            coeffs.append(self.anisotropySource)
+            
+        if self.order > 2:
+            coeffs += self.lowerOrderDiffusionTerm._getMatrixCoeffs(var)
+            
+        return coeffs
+
     def _getDiffusionGeomCoeff(self, var):
         if var is self.var or self.var is None:
             return self._getGeomCoeff(var)
@@ -54,10 +54,10 @@ class _BinaryTerm(_AbstractBinaryTerm):
         
         """
 
-        matrix = SparseMatrix(mesh=var.mesh)
+        matrix = None
         RHSvector = 0
 
-        for term in (self.term, self.other):
+        for term in self._unrolledTerms:
             
             tmpVar, tmpMatrix, tmpRHSvector = term._buildAndAddMatrices(var,
                                                                         SparseMatrix,
@@ -67,13 +67,51 @@ class _BinaryTerm(_AbstractBinaryTerm):
                                                                         diffusionGeomCoeff=diffusionGeomCoeff,
                                                                         buildExplicitIfOther=buildExplicitIfOther)
 
-            matrix += tmpMatrix
-            RHSvector += tmpRHSvector
-
             term._buildCache(tmpMatrix, tmpRHSvector)
 
+            if matrix is None and not term._cacheMatrix:
+                # accumulate directly into the first constituent matrix
+                # rather than adding it to an empty one
+                matrix = tmpMatrix
+            else:
+                if matrix is None:
+                    matrix = SparseMatrix(mesh=var.mesh)
+                matrix += tmpMatrix
+            RHSvector += tmpRHSvector
+
         return (var, matrix, RHSvector)
     
+    @property
+    def _unrolledTerms(self):
+        """The constituent `Term` objects of a (possibly nested) sum, left to right
+
+        Nested `_BinaryTerm` objects are unrolled so that building a long
+        sum is a single loop rather than a recursion per `+`, except where
+        a nested sum has to cache its own matrix or RHS vector.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=2)
+        >>> v = CellVariable(mesh=m)
+        >>> a, b, c, d = [ImplicitSourceTerm(coeff=i, var=v) for i in (1., 2., 3., 4.)]
+        >>> eq = (a + b) + (c + d)
+        >>> [t is u for t, u in zip(eq._unrolledTerms, (a, b, c, d))]
+        [True, True, True, True]
+        >>> eq.term.cacheMatrix()
+        >>> [t is u for t, u in zip(eq._unrolledTerms, (eq.term, c, d))]
+        [True, True, True]
+        """
+        terms = []
+        stack = [self.other, self.term]
+        while stack:
+            term = stack.pop()
+            if (isinstance(term, _BinaryTerm) 
+                and not (term._cacheMatrix or term._cacheRHSvector)):
+                stack += [term.other, term.term]
+            else:
+                terms.append(term)
+                
+        return terms
+    
     def _getDefaultSolver(self, var, solver, *args, **kwargs):
         for term in (self.term, self.other):
             defaultSolver = term._getDefaultSolver(var, solver, *args, **kwargs)
@@ -86,7 +124,10 @@ class _BinaryTerm(_AbstractBinaryTerm):
         return '(' + repr(self.term) + ' + ' + repr(self.other) + ')'
 
     def __mul__(self, other):
-        return other * self.term + other * self.other
+        if isinstance(other, (int, float)) and other == 1:
+            return self
+        else:
+            return other * self.term + other * self.other
 
     @property
     def _uncoupledTerms(self):
@@ -61,9 +61,12 @@ class CellTerm(_NonDiffusionTerm):
              raise TypeError, "The coefficient can not be a FaceVariable."
 
         _NonDiffusionTerm.__init__(self, coeff=coeff, var=var)
-        self.coeffVectors = None
         self._var = None
 
+    def _resetGeomCoeff(self):
+        _NonDiffusionTerm._resetGeomCoeff(self)
+        self.coeffVectors = None
+
     def _checkCoeff(self, var):
         if isinstance(self.coeff, CellVariable):
             shape = self.coeff.shape[:-1]
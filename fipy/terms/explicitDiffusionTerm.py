@@ -64,6 +64,11 @@ class ExplicitDiffusionTerm(_AbstractDiffusionTerm):
 
         return (var, SparseMatrix(mesh=var.mesh), b - L * var.value)
         
+    @property
+    def _canReuseMatrix(self):
+        ## the right hand side holds the old values of `var`
+        return False
+
     def _getNormals(self, mesh):
         return mesh._faceCellToCellNormals
 
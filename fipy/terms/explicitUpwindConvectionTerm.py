@@ -54,6 +54,11 @@ class ExplicitUpwindConvectionTerm(_AbstractUpwindConvectionTerm):
     For further details see :ref:`sec:NumericalSchemes`.
     """
 
+    @property
+    def _canReuseMatrix(self):
+        ## the right hand side holds the old values of `var`
+        return False
+
     def _getOldAdjacentValues(self, oldArray, id1, id2, dt):
         if dt is None:
             raise TransientTermError
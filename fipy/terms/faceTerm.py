@@ -34,9 +34,8 @@
  
 __docformat__ = 'restructuredtext'
 
-import os
-
 from fipy.terms.nonDiffusionTerm import _NonDiffusionTerm
+from fipy.terms import _displayMatrices
 from fipy.tools import vector
 from fipy.tools import numerix
 from fipy.tools import inline
@@ -52,6 +51,9 @@ class FaceTerm(_NonDiffusionTerm):
             raise NotImplementedError, "can't instantiate abstract base class"
             
         _NonDiffusionTerm.__init__(self, coeff=coeff, var=var)
+
+    def _resetGeomCoeff(self):
+        _NonDiffusionTerm._resetGeomCoeff(self)
         self.coeffMatrix = None
 
     def _getCoeffMatrix_(self, var, weight):
@@ -82,7 +84,7 @@ class FaceTerm(_NonDiffusionTerm):
         for boundaryCondition in boundaryConditions:
             LL, bb = boundaryCondition._buildMatrix(SparseMatrix, N, M, coeffMatrix)
             
-            if 'FIPY_DISPLAY_MATRIX' in os.environ:
+            if _displayMatrices:
                 self._viewer.title = r"%s %s" % (boundaryCondition.__class__.__name__, self.__class__.__name__)
                 self._viewer.plot(matrix=LL, RHSvector=bb)
                 from fipy import raw_input
@@ -156,18 +158,16 @@ class FaceTerm(_NonDiffusionTerm):
             cell2diag = numerix.take(coeffMatrix['cell 2 diag'], interiorFaces)
             cell2offdiag = numerix.take(coeffMatrix['cell 2 offdiag'], interiorFaces)
 
-            vector.putAdd(b, id1, -(cell1diag * oldArrayId1 + cell1offdiag * oldArrayId2))
-            vector.putAdd(b, id2, -(cell2diag * oldArrayId2 + cell2offdiag * oldArrayId1))
+            vector.putAdd(b, numerix.concatenate((id1, id2)), 
+                          -numerix.concatenate((cell1diag * oldArrayId1 + cell1offdiag * oldArrayId2,
+                                                cell2diag * oldArrayId2 + cell2offdiag * oldArrayId1)))
 
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
         """Implicit portion considers
         """
         mesh = var.mesh
-        id1, id2 = mesh._adjacentCellIDs
-        interiorFaces = numerix.nonzero(mesh.interiorFaces)[0]
-    
-        id1 = numerix.take(id1, interiorFaces)
-        id2 = numerix.take(id2, interiorFaces)
+        id1, id2 = mesh._interiorAdjacentCellIDs
+        interiorFaces = mesh.interiorFaceIDs
         
         b = numerix.zeros(var.shape,'d').ravel()      
         L = SparseMatrix(mesh=mesh)
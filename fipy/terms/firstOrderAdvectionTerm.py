@@ -118,6 +118,11 @@ class FirstOrderAdvectionTerm(_NonDiffusionTerm):
         _NonDiffusionTerm.__init__(self)
         self.geomCoeff = coeff
 
+    @property
+    def _canReuseMatrix(self):
+        ## the right hand side holds the old values of `var`
+        return False
+
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, equation=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
 
         oldArray = var.old
@@ -139,12 +144,12 @@ class FirstOrderAdvectionTerm(_NonDiffusionTerm):
             differences = self._getDifferences(adjacentValues, cellValues, oldArray, cellToCellIDs, mesh)
             differences = MA.filled(differences, 0)
 
-            minsq = numerix.sqrt(numerix.sum(numerix.minimum(differences, numerix.zeros((NCellFaces, NCells), 'l'))**2, axis=0))
-            maxsq = numerix.sqrt(numerix.sum(numerix.maximum(differences, numerix.zeros((NCellFaces, NCells), 'l'))**2, axis=0))
+            minsq = numerix.sqrt(numerix.sum(numerix.minimum(differences, 0.)**2, axis=0))
+            maxsq = numerix.sqrt(numerix.sum(numerix.maximum(differences, 0.)**2, axis=0))
 
             coeff = numerix.array(self._getGeomCoeff(var))
 
-            coeffXdiffereneces = coeff * ((coeff > 0.) * minsq + (coeff < 0.) * maxsq)
+            coeffXdiffereneces = coeff * numerix.where(coeff > 0., minsq, maxsq)
         else:
             coeffXdiffereneces = 0.
 
@@ -50,10 +50,7 @@ class _NonDiffusionTerm(_UnaryTerm):
            __NonDiffusionTerm(coeff=-1.0)
 
         """
-        if isinstance(self.coeff, (tuple, list)):
-            return self.__class__(coeff=-numerix.array(self.coeff), var=self.var)
-        else:
-            return self.__class__(coeff=-self.coeff, var=self.var)
+        return self.__class__(coeff=-self._arrayCoeff, var=self.var)
 
     def __mul__(self, other):
         r"""
@@ -61,6 +58,14 @@ class _NonDiffusionTerm(_UnaryTerm):
 
             >>> 2. * __NonDiffusionTerm(coeff=0.5)
             __NonDiffusionTerm(coeff=1.0)
+
+        Scaling by one returns the term itself, and by minus one its negation.
+
+            >>> t = __NonDiffusionTerm(coeff=0.5)
+            >>> (1 * t) is t
+            True
+            >>> -1. * t
+            __NonDiffusionTerm(coeff=-0.5)
             
         Test for ticket:291.
 
@@ -72,16 +77,35 @@ class _NonDiffusionTerm(_UnaryTerm):
         """
 
         if isinstance(other, (int, float)):
-            if isinstance(self.coeff, (list, tuple)):
-                coeff = numerix.array(self.coeff)
+            if other == 1 and not isinstance(self.coeff, (tuple, list)):
+                return self
+            elif other == -1:
+                return -self
             else:
-                coeff = self.coeff
-            return self.__class__(coeff=other * coeff, var=self.var)
+                return self.__class__(coeff=other * self._arrayCoeff, var=self.var)
         else:
             raise TermMultiplyError
             
     __rmul__ = __mul__
 
+    @property
+    def _arrayCoeff(self):
+        """
+        The coefficient, with a tuple or list converted to an array only once
+        rather than on every negation or multiplication.
+        """
+        if isinstance(self.coeff, (tuple, list)):
+            if not hasattr(self, '_coeffArray'):
+                self._coeffArray = numerix.array(self.coeff)
+            return self._coeffArray
+        else:
+            return self.coeff
+
+    def _resetGeomCoeff(self):
+        _UnaryTerm._resetGeomCoeff(self)
+        if hasattr(self, '_coeffArray'):
+            del self._coeffArray
+
     @property
     def _diffusionVars(self):
         return []
@@ -54,6 +54,11 @@ class ResidualTerm(_ExplicitSourceTerm):
     def __repr__(self):
         return r"$\Delta$[" + repr(self.equation) + "]"
 
+    @property
+    def _canReuseMatrix(self):
+        ## the right hand side is the current residual of `equation`
+        return False
+
     def _getGeomCoeff(self, var):
         return self.coeff
         
@@ -63,8 +68,6 @@ class ResidualTerm(_ExplicitSourceTerm):
                                                dt=dt)
 
         self.coeff = CellVariable(mesh=var.mesh, value=vec * self.underRelaxation)
-        self.geomCoeff = None
-        self.coeffVectors = None
         
         return _ExplicitSourceTerm._buildMatrix(self, var=var, SparseMatrix=SparseMatrix, boundaryConditions=boundaryConditions, dt=dt, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
 
@@ -34,11 +34,10 @@
 
 __docformat__ = 'restructuredtext'
 
-import os
-
 from fipy.tools import numerix
 from fipy.terms import AbstractBaseClassError
 from fipy.terms import SolutionVariableRequiredError
+from fipy.terms import _displayMatrices
 from fipy.tools.decorators import getsetDeprecated
 
 __all__ = ["Term"]
@@ -62,13 +61,45 @@ class Term(object):
             raise AbstractBaseClassError
 
         self.coeff = coeff
-        self.geomCoeff = None
         self._cacheMatrix = False
         self._matrix = None
         self._cacheRHSvector = False
         self._RHSvector = None
+        self._reuseMatrix = False
+        self._matrixCache = None
         self.var = var
         
+    def _getCoeff(self):
+        return self._coeff
+        
+    def _setCoeff(self, coeff):
+        self._coeff = coeff
+        self._resetGeomCoeff()
+        
+    coeff = property(_getCoeff, _setCoeff)
+    
+    def _resetGeomCoeff(self):
+        """
+        Discard anything derived from the coefficient object. Changes to the
+        *value* of a `Variable` coefficient already propagate through
+        `geomCoeff`, so this is only needed when `coeff` is reassigned.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> v = CellVariable(mesh=m)
+        >>> t = ImplicitSourceTerm(coeff=CellVariable(mesh=m, value=1.))
+        >>> geomCoeff = t._getGeomCoeff(v)
+        >>> t._getGeomCoeff(v) is geomCoeff
+        True
+        >>> t.coeff = CellVariable(mesh=m, value=2.)
+        >>> t._getGeomCoeff(v) is geomCoeff
+        False
+        >>> print numerix.allclose(t._getGeomCoeff(v), 2 * m.cellVolumes)
+        True
+        """
+        self.geomCoeff = None
+        self._matrixCache = None
+
     @getsetDeprecated
     def _getVars(self):
         return self._vars
@@ -145,10 +176,44 @@ class Term(object):
         return SparseMatrix
 
     def _prepareLinearSystem(self, var, solver, boundaryConditions, dt):
+        """
+        The system left in a reused solver by the previous solution is
+        released before the next one is assembled (Trilinos solvers keep
+        and refill their matrix object instead).
+
+        >>> from fipy import *
+        >>> import weakref
+        >>> m = Grid1D(nx=10, dx=0.1)
+        >>> v = CellVariable(mesh=m)
+        >>> v.constrain(0., m.facesLeft)
+        >>> v.constrain(1., m.facesRight)
+        >>> eq = DiffusionTerm()
+        >>> solver = DefaultSolver()
+        >>> res = eq.sweep(v, solver=solver)
+        >>> previous = weakref.ref(solver.matrix)
+        >>> released = []
+        >>> build = eq._buildAndAddMatrices
+        >>> def buildAndAddMatrices(*args, **kwargs):
+        ...     released.append(previous() is None)
+        ...     return build(*args, **kwargs)
+        >>> eq._buildAndAddMatrices = buildAndAddMatrices
+        >>> import fipy.solvers.solver
+        >>> for sweep in range(3):
+        ...     v.value = 0.
+        ...     res = eq.sweep(v, solver=solver)
+        ...     previous = weakref.ref(solver.matrix)
+        ...     print released[-1] or fipy.solvers.solver == 'trilinos', 
+        ...     print numerix.allclose(v, m.cellCenters[0], atol=1e-5)
+        True True
+        True True
+        True True
+        """
         solver = self.getDefaultSolver(var, solver)
             
         var = self._verifyVar(var)
         self._checkVar(var)
+        
+        solver._releaseMatrix()
 
         if type(boundaryConditions) not in (type(()), type([])):
             boundaryConditions = (boundaryConditions,)
@@ -156,11 +221,6 @@ class Term(object):
         for bc in boundaryConditions:
             bc._resetBoundaryConditionApplied()
 
-        if 'FIPY_DISPLAY_MATRIX' in os.environ:
-            if not hasattr(self, "_viewer"):
-                from fipy.viewers.matplotlibViewer.matplotlibSparseMatrixViewer import MatplotlibSparseMatrixViewer
-                Term._viewer = MatplotlibSparseMatrixViewer()
-
         var, matrix, RHSvector = self._buildAndAddMatrices(var,
                                                            self._getMatrixClass(solver, var),
                                                            boundaryConditions=boundaryConditions,
@@ -173,25 +233,39 @@ class Term(object):
         
         solver._storeMatrix(var=var, matrix=matrix, RHSvector=RHSvector)
         
-        if 'FIPY_DISPLAY_MATRIX' in os.environ:
-            if var is None:
-                name = ""
-            else:
-                if not hasattr(var, "name"):
-                    name = ""
-                else:
-                    name = var.name
-            self._viewer.title = r"%s %s" % (name, repr(self))
-            from fipy.variables.coupledCellVariable import _CoupledCellVariable
-            if isinstance(solver.RHSvector, _CoupledCellVariable):
-                RHSvector = solver.RHSvector.globalValue
-            else:
-                RHSvector = solver.RHSvector
-            self._viewer.plot(matrix=solver.matrix, RHSvector=RHSvector)
-            from fipy import raw_input            
-            raw_input()
+        if _displayMatrices:
+            self._displayMatrix(var, solver)
             
         return solver
+
+    @property
+    def _viewer(self):
+        """
+        The viewer shared by all `Term` objects for `FIPY_DISPLAY_MATRIX`,
+        only imported and created the first time a matrix is displayed.
+        """
+        if not hasattr(Term, "_matrixViewer"):
+            from fipy.viewers.matplotlibViewer.matplotlibSparseMatrixViewer import MatplotlibSparseMatrixViewer
+            Term._matrixViewer = MatplotlibSparseMatrixViewer()
+        return Term._matrixViewer
+
+    def _displayMatrix(self, var, solver):
+        if var is None:
+            name = ""
+        else:
+            if not hasattr(var, "name"):
+                name = ""
+            else:
+                name = var.name
+        self._viewer.title = r"%s %s" % (name, repr(self))
+        from fipy.variables.coupledCellVariable import _CoupledCellVariable
+        if isinstance(solver.RHSvector, _CoupledCellVariable):
+            RHSvector = solver.RHSvector.globalValue
+        else:
+            RHSvector = solver.RHSvector
+        self._viewer.plot(matrix=solver.matrix, RHSvector=RHSvector)
+        from fipy import raw_input            
+        raw_input()
     
     def solve(self, var=None, solver=None, boundaryConditions=(), dt=None):
         r"""
@@ -369,6 +443,59 @@ class Term(object):
 
         return self._matrix
 
+    def reuseMatrix(self):
+        r"""
+        Informs `solve()` and `sweep()` that the matrix and right hand side
+        vector of this `Term` can be kept between calls, so that they are
+        only assembled again when the solution variable, mesh, time step,
+        boundary conditions or the value of a `Variable` coefficient differ
+        from the previous call. Terms that read the old value of the
+        solution variable, such as `TransientTerm` and the explicit terms,
+        are always assembled again.
+
+        Changes that cannot be detected, such as to the value of a
+        constraint, require a call to `invalidateMatrixCache()`.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> v = CellVariable(mesh=m, value=1.)
+        >>> D = Variable(value=1.)
+        >>> eq = DiffusionTerm(coeff=D) - ImplicitSourceTerm(coeff=1.)
+        >>> eq.reuseMatrix()
+        >>> eq.cacheMatrix()
+        >>> eq.solve(var=v, solver=DummySolver())
+        >>> print numerix.allclose(eq.matrix.numpyArray.diagonal(), (-2, -3, -2))
+        True
+        >>> D.value = 2.
+        >>> eq.solve(var=v, solver=DummySolver())
+        >>> print numerix.allclose(eq.matrix.numpyArray.diagonal(), (-3, -5, -3))
+        True
+
+        Transient problems give the same solution with and without reuse
+
+        >>> v0 = CellVariable(mesh=m, value=m.cellCenters[0], hasOld=True)
+        >>> v1 = CellVariable(mesh=m, value=m.cellCenters[0], hasOld=True)
+        >>> eq0 = TransientTerm() == DiffusionTerm(coeff=D)
+        >>> eq1 = TransientTerm() == DiffusionTerm(coeff=D)
+        >>> eq1.reuseMatrix()
+        >>> for step in range(3):
+        ...     v0.updateOld()
+        ...     v1.updateOld()
+        ...     eq0.solve(var=v0, dt=0.1, solver=DummySolver())
+        ...     eq1.solve(var=v1, dt=0.1, solver=DummySolver())
+        >>> print numerix.allclose(v0, v1)
+        True
+        """
+        self._reuseMatrix = self._canReuseMatrix
+
+    def invalidateMatrixCache(self):
+        r"""
+        Discard the matrix and right hand side vector held for
+        `reuseMatrix()`, forcing the next `solve()` or `sweep()` to assemble
+        them again.
+        """
+        self._matrixCache = None
+
     def cacheRHSvector(self):
         r"""        
         Informs `solve()` and `sweep()` to cache their right hand side
@@ -435,7 +562,10 @@ class Term(object):
     __rmul__ = __mul__
 
     def __truediv__(self, other):
-        return (1 / other) * self
+        if isinstance(other, (int, float)) and other == 1:
+            return self
+        else:
+            return (1 / other) * self
 
     __div__ = __truediv__
     
@@ -147,6 +147,11 @@ class TransientTerm(CellTerm):
         else:
             return None
 
+    @property
+    def _canReuseMatrix(self):
+        ## the right hand side holds the old values of `var`
+        return False
+
     @property
     def _transientVars(self):
         return self._vars
@@ -36,10 +36,12 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
-import os
+import weakref
 
 from fipy.tools import numerix
+from fipy.variables.variable import Variable
 from fipy.terms.term import Term
+from fipy.terms import _displayTermMatrices
 
 class _UnaryTerm(Term):
 
@@ -74,6 +76,10 @@ class _UnaryTerm(Term):
     def _buildExplcitIfOther(self):
         return False
 
+    @property
+    def _canReuseMatrix(self):
+        return True
+
     def _buildAndAddMatrices(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None, buildExplicitIfOther=False):
         """Build matrices of constituent Terms and collect them
 
@@ -90,7 +96,14 @@ class _UnaryTerm(Term):
         
         """
 
-        if var is self.var or self.var is None:
+        if (var is self.var or self.var is None) and self._reuseMatrix:
+            var, matrix, RHSvector = self._reuseOrBuildMatrix(var,
+                                                              SparseMatrix,
+                                                              boundaryConditions=boundaryConditions,
+                                                              dt=dt,
+                                                              transientGeomCoeff=transientGeomCoeff,
+                                                              diffusionGeomCoeff=diffusionGeomCoeff)
+        elif var is self.var or self.var is None:
             var, matrix, RHSvector = self._buildMatrix(var,
                                                        SparseMatrix,
                                                        boundaryConditions=boundaryConditions,
@@ -110,14 +123,98 @@ class _UnaryTerm(Term):
             RHSvector = numerix.zeros(len(var.ravel()),'d')
             matrix = SparseMatrix(mesh=var.mesh)
             
-        if ('FIPY_DISPLAY_MATRIX' in os.environ
-             and "terms" in os.environ['FIPY_DISPLAY_MATRIX'].lower().split()): 
+        if _displayTermMatrices:
              self._viewer.title = "%s %s" % (var.name, repr(self))
              self._viewer.plot(matrix=matrix, RHSvector=RHSvector) 
              raw_input()
              
         return (var, matrix, RHSvector)
 
+    def _reuseOrBuildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Assemble the matrix only if its inputs changed since the last call
+
+        The held matrix and vector are never handed out directly, as
+        solvers modify them in place (e.g., under-relaxation).
+
+        The inputs are held by weak reference and compared by identity, so
+        the cache neither keeps them alive nor mistakes a new object for a
+        discarded one. Changes to the value of a `Variable` coefficient
+        are detected through the geometric coefficients going stale.
+        
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> v = CellVariable(mesh=m)
+        >>> D = Variable(value=1.)
+        >>> t = DiffusionTerm(coeff=D)
+        >>> SparseMatrix = DummySolver()._matrixClass
+        >>> v, L0, b0 = t._reuseOrBuildMatrix(v, SparseMatrix)
+        >>> cached = t._matrixCache
+        >>> v, L1, b1 = t._reuseOrBuildMatrix(v, SparseMatrix)
+        >>> t._matrixCache is cached
+        True
+        >>> D.value = 2.
+        >>> v, L2, b2 = t._reuseOrBuildMatrix(v, SparseMatrix)
+        >>> t._matrixCache is cached
+        False
+        >>> print numerix.allclose(L2.numpyArray.diagonal(), (-2, -4, -2))
+        True
+        >>> cached = t._matrixCache
+        >>> v2 = CellVariable(mesh=m)
+        >>> v2, L3, b3 = t._reuseOrBuildMatrix(v2, SparseMatrix)
+        >>> t._matrixCache is cached
+        False
+        >>> class OtherSparseMatrix(SparseMatrix):
+        ...     pass
+        >>> v2, L4, b4 = t._reuseOrBuildMatrix(v2, OtherSparseMatrix)
+        >>> isinstance(L4, OtherSparseMatrix)
+        True
+        """
+        if dt is not None:
+            dt = float(dt)
+        inputs = (var, var.mesh, SparseMatrix) + tuple(boundaryConditions)
+
+        if not self._matrixCacheMatches(inputs, dt):
+            var, matrix, RHSvector = self._buildMatrix(var,
+                                                       SparseMatrix,
+                                                       boundaryConditions=boundaryConditions,
+                                                       dt=dt,
+                                                       transientGeomCoeff=transientGeomCoeff,
+                                                       diffusionGeomCoeff=diffusionGeomCoeff)
+            self._matrixCache = ([weakref.ref(obj) for obj in inputs], dt, 
+                                 self._watchMatrixCoeffs(var), matrix, RHSvector)
+
+        refs, cachedDt, watcher, cachedMatrix, cachedRHSvector = self._matrixCache
+
+        matrix = SparseMatrix(mesh=var.mesh)
+        matrix += cachedMatrix
+
+        return (var, matrix, numerix.array(cachedRHSvector))
+
+    def _matrixCacheMatches(self, inputs, dt):
+        if self._matrixCache is None:
+            return False
+            
+        refs, cachedDt, watcher = self._matrixCache[:3]
+        
+        return (not watcher.stale
+                and cachedDt == dt 
+                and len(refs) == len(inputs)
+                and all([ref() is obj for ref, obj in zip(refs, inputs)]))
+
+    def _getMatrixCoeffs(self, var):
+        """The coefficients that the assembled matrix depends on"""
+        return [self._getGeomCoeff(var)]
+        
+    def _watchMatrixCoeffs(self, var):
+        coeffs = [coeff for coeff in self._getMatrixCoeffs(var) if isinstance(coeff, Variable)]
+        
+        ## a stale `Variable` does not notify its subscribers again, so the
+        ## coefficients must be fresh for the next change to be seen
+        for coeff in coeffs:
+            coeff.value
+            
+        return _StaleWatcher(coeffs)
+
     def _reshapeIDs(self, var, ids):
         shape = (self._vectorSize(var), self._vectorSize(var), ids.shape[-1])
         ids = numerix.resize(ids, shape)
@@ -137,12 +234,19 @@ class _UnaryTerm(Term):
             return solver
 
     def _checkVar(self, var):
-        if ((var is not None) 
-            and (numerix.sctype2char(var.getsctype()) not in numerix.typecodes['Float'])):
+        ## a `Variable`'s sctype never changes once determined, so only the
+        ## first solution for each variable needs to be checked; a weak
+        ## reference guards against a later variable reusing the same id
+        if var is None or (hasattr(self, '_checkedVar') and self._checkedVar() is var):
+            return
+            
+        if numerix.sctype2char(var.getsctype()) not in numerix.typecodes['Float']:
             import warnings
             warnings.warn("""sweep() or solve() are likely to produce erroneous results when `var` does not contain floats.""",
                           UserWarning, stacklevel=4)    
 
+        self._checkedVar = weakref.ref(var)
+
     def _test(self):
         """
         Offset tests
@@ -216,6 +320,28 @@ class _UnaryTerm(Term):
 
         """
         
+class _StaleWatcher(Variable):
+    """
+    Goes stale as soon as any of the watched variables changes, without
+    ever evaluating them.
+
+    >>> a = Variable(value=1.)
+    >>> b = a * 2
+    >>> print b
+    2.0
+    >>> watcher = _StaleWatcher([b])
+    >>> print watcher.stale
+    0
+    >>> a.value = 3.
+    >>> print watcher.stale
+    1
+    """
+    def __init__(self, watched):
+        Variable.__init__(self, value=None)
+        for var in watched:
+            self._requires(var)
+        self._markFresh()
+        
 class __UnaryTerm(_UnaryTerm): 
     """
     Dummy subclass for tests
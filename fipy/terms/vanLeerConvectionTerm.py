@@ -39,8 +39,11 @@
 
 __docformat__ = 'restructuredtext'
 
+import weakref
+
 from fipy.terms.explicitUpwindConvectionTerm import ExplicitUpwindConvectionTerm
 from fipy.tools import numerix
+from fipy.tools import inline
 
 __all__ = ["VanLeerConvectionTerm"]
 
@@ -49,44 +52,197 @@ class VanLeerConvectionTerm(ExplicitUpwindConvectionTerm):
     def _getGradient(self, normalGradient, gradUpwind):
         gradUpUpwind = -gradUpwind + 2 * normalGradient
 
-        avg = 0.5 * (abs(gradUpwind) + abs(gradUpUpwind))
-        min3 = numerix.minimum(numerix.minimum(abs(2 * gradUpwind),
-                                               abs(2 * gradUpUpwind)), avg)
+        absUpwind = abs(gradUpwind)
+        absUpUpwind = abs(gradUpUpwind)
+        
+        ## min(|2 a|, |2 b|) == 2 min(|a|, |b|)
+        min3 = numerix.minimum(2 * numerix.minimum(absUpwind, absUpUpwind),
+                               0.5 * (absUpwind + absUpUpwind))
 
-        grad = numerix.where(gradUpwind * gradUpUpwind < 0.,
-                             0., 
-                             numerix.where(gradUpUpwind > 0.,
-                                           min3,
-                                           -min3))
+        ## (sign(a) + sign(b)) / 2 is 0 when the gradients disagree in
+        ## sign and +/-1 otherwise, so no nested `where()` is needed
+        ## (whenever either gradient vanishes, `min3` does too)
+        return 0.5 * (numerix.sign(gradUpwind) + numerix.sign(gradUpUpwind)) * min3
 
-        return grad
-        
-    def _getOldAdjacentValues(self, oldArray, id1, id2, dt):
+    def _getOldAdjacentValuesInline(self, oldArray, id1, id2, dt):
         oldArray1, oldArray2 = ExplicitUpwindConvectionTerm._getOldAdjacentValues(self, oldArray, id1, id2, dt)
-        
+        oldArray1 = numerix.array(oldArray1, 'd')
+        oldArray2 = numerix.array(oldArray2, 'd')
+
         mesh = oldArray.mesh
 
-        interiorIDs = numerix.nonzero(mesh.interiorFaces)[0]
-        interiorFaceAreas = numerix.take(mesh._faceAreas, interiorIDs)
-        interiorFaceNormals = numerix.take(mesh._orientedFaceNormals, interiorIDs, axis=-1)
-        
+        ## gather, limit and correct both sides of each interior face
+        ## in one compiled loop, without any per-face temporaries
+        inline._runInline("""
+            long int faceID = interiorIDs[i];
+            long int cellIDs[2] = {id1[i], id2[i]};
+            double gradUpwind = (oldArray2[i] - oldArray1[i]) / cellDistances[faceID];
+            double CFL = fabs(geomCoeff[faceID]) * dt;
+            double halfInverseArea = 0.5 / faceAreas[faceID];
+            double correction[2];
+            int side, d;
+
+            for (side = 0; side < 2; side++) {
+                double sign = (side == 0 ? 1. : -1.);
+                double normalGradient = 0.;
+                
+                for (d = 0; d < dim; d++) {
+                    normalGradient += sign * grad[d * numberOfCells + cellIDs[side]] 
+                      * faceNormals[d * numberOfFaces + faceID];
+                }
+                
+                double gradU = sign * gradUpwind;
+                double gradUU = 2 * normalGradient - gradU;
+                double limited = 0.;
+                
+                if (gradU * gradUU >= 0.) {
+                    double absU = fabs(gradU);
+                    double absUU = fabs(gradUU);
+                    double min3 = 2 * (absU < absUU ? absU : absUU);
+                    double avg = 0.5 * (absU + absUU);
+                    
+                    if (avg < min3) {
+                        min3 = avg;
+                    }
+                    
+                    limited = gradUU > 0. ? min3 : -min3;
+                }
+                
+                correction[side] = limited * (cellVolumes[cellIDs[side]] - CFL) * halfInverseArea;
+            }
+            
+            oldArray1[i] += correction[0];
+            oldArray2[i] += correction[1];
+        """,
+        oldArray1=oldArray1,
+        oldArray2=oldArray2,
+        id1=numerix.array(id1, 'l'),
+        id2=numerix.array(id2, 'l'),
+        interiorIDs=numerix.array(mesh.interiorFaceIDs, 'l'),
+        grad=numerix.array(oldArray.grad, 'd'),
+        faceNormals=numerix.array(mesh._orientedFaceNormals, 'd'),
+        faceAreas=numerix.array(mesh._faceAreas, 'd'),
+        cellDistances=numerix.array(mesh._cellDistances, 'd'),
+        cellVolumes=numerix.array(mesh.cellVolumes, 'd'),
+        geomCoeff=numerix.array(self._getGeomCoeff(oldArray), 'd'),
+        dt=float(dt),
+        dim=mesh.dim,
+        numberOfCells=mesh.numberOfCells,
+        numberOfFaces=mesh.numberOfFaces,
+        ni=len(id1))
+
+        return oldArray1, oldArray2
+
+    def _getOldAdjacentValuesNoInline(self, oldArray, id1, id2, dt):
+        oldArray1, oldArray2 = ExplicitUpwindConvectionTerm._getOldAdjacentValues(self, oldArray, id1, id2, dt)
+    
+        mesh = oldArray.mesh
+        ids, interiorFaceNormals, interiorCellDistances, vol, halfInverseArea = self._getInteriorGeometry(mesh)
+        interiorIDs = mesh.interiorFaceIDs
+    
         # Courant-Friedrichs-Levy number
-        interiorCFL = abs(numerix.take(self._getGeomCoeff(oldArray), interiorIDs)) * dt
-        
-        gradUpwind = (oldArray2 - oldArray1) / numerix.take(mesh._cellDistances, interiorIDs)
-        
-        vol1 = numerix.take(mesh.cellVolumes, id1)
-        
-        oldArray1 += 0.5 * self._getGradient(numerix.dot(numerix.take(oldArray.grad, id1, axis=-1), interiorFaceNormals), gradUpwind) \
-            * (vol1 - interiorCFL) / interiorFaceAreas
+        interiorCFL = self._gather('CFL', self._getGeomCoeff(oldArray), interiorIDs)
+        numerix.absolute(interiorCFL, interiorCFL)
+        interiorCFL *= dt
+    
+        gradUpwind = oldArray2 - oldArray1
+        gradUpwind /= interiorCellDistances
+    
+        ## limit both sides of every interior face in a single pass, with
+        ## the cell 2 side seeing the negated normal and upwind gradient
+        N = len(id1)
 
-        vol2 = numerix.take(mesh.cellVolumes, id2)
-        
-        oldArray2 += 0.5 * self._getGradient(numerix.dot(numerix.take(oldArray.grad, id2, axis=-1), -interiorFaceNormals), -gradUpwind) \
-            * (vol2 - interiorCFL) / interiorFaceAreas
-        
+        ## the gradient is stored one component per row, so project it
+        ## onto the normals a row at a time over unit-stride data
+        ## instead of forming a (dim, 2N) product
+        oldGrad = self._gather('grad', oldArray.grad, ids)
+        normalGradient = numerix.zeros((2, N), 'd')
+        for component, normal in zip(oldGrad, interiorFaceNormals):
+            normalGradient += numerix.reshape(component, (2, N)) * normal
+        normalGradient[1] *= -1
+
+        grad = self._getGradient(normalGradient.ravel(),
+                                 numerix.concatenate((gradUpwind, -gradUpwind)))
+
+        correction = numerix.reshape(grad, (2, N)) * (vol - interiorCFL) * halfInverseArea
+
+        oldArray1 += correction[0]
+        oldArray2 += correction[1]
+    
         return oldArray1, oldArray2
 
+    def _getInteriorGeometry(self, mesh):
+        """
+        The quantities that depend only on the mesh, gathered at the
+        interior faces once per mesh rather than on every sweep: the
+        cell IDs on both sides, the face normals, the cell distances, the
+        cell volumes on both sides (shape `(2, N)`), and half the
+        reciprocal of the face areas (one reciprocal per face, shared by
+        both of its cells).
+        
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> t = VanLeerConvectionTerm(((1.,),))
+        >>> t._getInteriorGeometry(m) is t._getInteriorGeometry(m)
+        True
+        >>> m2 = Grid1D(nx=5)
+        >>> print t._getInteriorGeometry(m2)[0]
+        [0 1 2 3 1 2 3 4]
+        >>> t._getInteriorGeometry(m) is t._getInteriorGeometry(m2)
+        False
+        """
+        if not (hasattr(self, '_interiorGeometryMesh') and self._interiorGeometryMesh() is mesh):
+            id1, id2 = mesh._interiorAdjacentCellIDs
+            interiorIDs = mesh.interiorFaceIDs
+            ids = numerix.concatenate((id1, id2))
+            self._interiorGeometry = (ids,
+                                      numerix.asarray(mesh._orientedFaceNormals).take(interiorIDs, axis=-1),
+                                      numerix.asarray(mesh._cellDistances).take(interiorIDs),
+                                      numerix.reshape(numerix.asarray(mesh.cellVolumes).take(ids), (2, len(id1))),
+                                      0.5 / numerix.asarray(mesh._faceAreas).take(interiorIDs))
+            ## a weak reference, so that the term does not keep the mesh
+            ## alive or mistake a new mesh for a discarded one
+            self._interiorGeometryMesh = weakref.ref(mesh)
+
+        return self._interiorGeometry
+
+    def _gather(self, name, a, indices):
+        """
+        Take `indices` along the last axis of `a` into a buffer that is
+        kept between calls, rather than allocating a new array (and going
+        through the type-dispatching `numerix.take()`) on every sweep.
+        The result is overwritten by the next gather of the same `name`.
+
+        The indices are mesh IDs and always in range, so `take()` is called
+        with `mode='clip'`; with the default `mode='raise'` it would still
+        fill a temporary and copy that into `out`.
+
+        >>> from fipy import *
+        >>> t = VanLeerConvectionTerm(((1.,),))
+        >>> a = numerix.array(((0., 1., 2., 3.), (4., 5., 6., 7.)))
+        >>> b = t._gather('a', a, numerix.array((3, 1, 1)))
+        >>> print numerix.allclose(b, ((3., 1., 1.), (7., 5., 5.)))
+        True
+        >>> t._gather('a', a, numerix.array((0, 2, 0))) is b
+        True
+        """
+        a = numerix.asarray(a)
+        shape = a.shape[:-1] + (len(indices),)
+
+        if not hasattr(self, '_gatherBuffers'):
+            self._gatherBuffers = {}
+        buffer = self._gatherBuffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != a.dtype:
+            buffer = self._gatherBuffers[name] = numerix.empty(shape, a.dtype)
+
+        return a.take(indices, axis=-1, out=buffer, mode='clip')
+
+    def _getOldAdjacentValues(self, oldArray, id1, id2, dt):
+        if inline.doInline:
+            return self._getOldAdjacentValuesInline(oldArray, id1, id2, dt)
+        else:
+            return self._getOldAdjacentValuesNoInline(oldArray, id1, id2, dt)
+
     def _test(self):
         """
         Test for ticket:441.
@@ -99,7 +255,24 @@ class VanLeerConvectionTerm(ExplicitUpwindConvectionTerm):
         Traceback (most recent call last):
            ...    
         TransientTermError: The equation requires a TransientTerm with explicit convection.
-    
+
+        The compiled and the NumPy corrections agree (the comparison only
+        does anything when run with `--inline`).
+
+        >>> m = Grid2D(nx=4, ny=3, dx=0.5, dy=0.25)
+        >>> x, y = m.cellCenters
+        >>> c = CellVariable(mesh=m, value=numerix.sin(3 * x) * y**2 - x)
+        >>> e = VanLeerConvectionTerm(((1.,), (-0.5,)))
+        >>> id1, id2 = m._interiorAdjacentCellIDs
+        >>> old1, old2 = e._getOldAdjacentValuesNoInline(c, id1, id2, dt=0.1)
+        >>> from fipy.tools import inline
+        >>> if inline.doInline:
+        ...     new1, new2 = e._getOldAdjacentValuesInline(c, id1, id2, dt=0.1)
+        ... else:
+        ...     new1, new2 = old1, old2
+        >>> print numerix.allclose(new1, old1), numerix.allclose(new2, old2)
+        True True
+
         """
         
 def _test(): 
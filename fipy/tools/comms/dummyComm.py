@@ -50,10 +50,10 @@ class DummyComm(SerialCommWrapper):
         return a.sum(axis=axis)
         
     def MaxAll(self, vec):
-        return max(numerix.array(vec))
+        return numerix.array(vec).max()
         
     def MinAll(self, vec):
-        return min(numerix.array(vec))
+        return numerix.array(vec).min()
 
     def __setstate__(self, dict):
         self.__init__()
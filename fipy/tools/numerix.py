@@ -975,7 +975,7 @@ def LINFnorm(arr):
       |\mathtt{arr}_j|^\infty]^\infty = \over{\max}{j} |\mathtt{arr}_j|` is the
       :math:`L^\infty`-norm of :math:`\mathtt{arr}`.
     """
-    return max(abs(arr))
+    return abs(arr).max()
 
 def _compressIndexSubspaces(index, i, broadcastshape = ()):
     """
@@ -44,28 +44,63 @@ __all__ = ["putAdd", "prune"]
 def _putAdd(vector, ids, additionVector, mask=False):
     """This is a temporary replacement for Numeric.put as it was not doing
     what we thought it was doing.
+
+    Contributions to repeated `ids` accumulate, as with `numpy.add.at`
+    
+        >>> ids = numerix.array((3, 0, 3, 1, 3))
+        >>> addition = numerix.array((1., 2., 3., 4., 5.))
+        >>> v = numerix.zeros(5)
+        >>> _putAdd(v, ids, addition)
+        >>> ref = numerix.zeros(5)
+        >>> numerix.add.at(ref, ids, addition)
+        >>> print numerix.allclose(v, ref), numerix.allclose(v, (2., 4., 0., 9., 0.))
+        True True
+
+    and, when `additionVector` has one more dimension than `vector`, each
+    row of a vector-valued `vector` is accumulated separately
+
+        >>> ids = numerix.array(((0, 2, 0), (3, 2, 0)))
+        >>> addition = numerix.reshape(numerix.arange(12.), (2, 2, 3))
+        >>> v = numerix.ones((2, 4))
+        >>> _putAdd(v, ids, addition)
+        >>> ref = numerix.ones((2, 4))
+        >>> for j in range(2):
+        ...     numerix.add.at(ref[j], ids.ravel(), addition[j].ravel())
+        >>> print numerix.allclose(v, ref)
+        True
+
+    Masked `ids` are dropped
+    
+        >>> mask = numerix.array(((False, True, False), (True, False, False)))
+        >>> v = numerix.ones((2, 4))
+        >>> _putAdd(v, numerix.MA.array(ids, mask=mask), addition, mask=mask)
+        >>> ref = numerix.ones((2, 4))
+        >>> for j in range(2):
+        ...     numerix.add.at(ref[j], ids[~mask], addition[j][~mask])
+        >>> print numerix.allclose(v, ref)
+        True
     """
     additionVector = numerix.array(additionVector)
 
+    ## masked `ids` are dropped, so their fill value is irrelevant
+    ids = numerix.ravel(numerix.MA.filled(ids, 0))
+
     if numerix.sometrue(mask):
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value, masked in zip(ids.flat, additionVector[j].flat, mask.flat):
-                    if not masked:
-                        vector[j].flat[id] += value
-        else:
-            for id, value, masked in zip(ids.flat, additionVector.flat, mask.flat):
-                if not masked:
-                    vector.flat[id] += value
+        unmasked = numerix.logical_not(numerix.ravel(mask))
+        ids = ids[unmasked]
+    else:
+        unmasked = slice(None)
 
+    if len(vector.shape) < len(additionVector.shape):
+        for j in range(vector.shape[0]):
+            _bincountAdd(vector[j], ids, numerix.ravel(additionVector[j])[unmasked])
     else:
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value in zip(ids.flat, additionVector[j].flat):
-                    vector[j].flat[id] += value
-        else:
-            for id, value in zip(ids.flat, additionVector.flat):
-                vector.flat[id] += value
+        _bincountAdd(vector, ids, numerix.ravel(additionVector)[unmasked])
+
+def _bincountAdd(vector, ids, additionVector):
+    ## accumulate repeated `ids` in a single pass
+    vector += numerix.reshape(numerix.bincount(ids, weights=additionVector, minlength=vector.size), 
+                              vector.shape)
 
 if inline.doInline:
     ## FIXME: inline version doesn't account for all of the conditions that Python 
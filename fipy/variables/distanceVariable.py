@@ -464,9 +464,7 @@ class DistanceVariable(CellVariable):
            
         """
         
-        M = self.mesh.dim
-        interfaceFlag = numerix.repeat(self._interfaceFlag[numerix.newaxis, ...], M, axis=0)
-        return numerix.where(interfaceFlag, self._levelSetNormals, 0)
+        return numerix.where(self._interfaceFlag[numerix.newaxis, ...], self._levelSetNormals, 0)
 
     @getsetDeprecated
     def _getInterfaceFlag(self):
@@ -490,10 +488,11 @@ class DistanceVariable(CellVariable):
            
         """
         adjacentCellIDs = self.mesh._adjacentCellIDs
-        val0 = numerix.take(numerix.array(self._value), adjacentCellIDs[0])
-        val1 = numerix.take(numerix.array(self._value), adjacentCellIDs[1])
+        value = numerix.asarray(self._value)
+        val0 = numerix.take(value, adjacentCellIDs[0])
+        val1 = numerix.take(value, adjacentCellIDs[1])
         
-        return numerix.where(val1 * val0 < 0, 1, 0)
+        return (val1 * val0 < 0).astype('l')
 
     @getsetDeprecated
     def _getCellInterfaceFlag(self):
@@ -568,21 +567,21 @@ class DistanceVariable(CellVariable):
            ...                              (0, 0, v, v, 0, 0, 0, v, 0, 0, v, 0)))
            >>> print numerix.allclose(distanceVariable._levelSetNormals, answer)
            True
+
+        The normals are cached until the distance function changes:
+
+           >>> distanceVariable._levelSetNormals is distanceVariable._levelSetNormals
+           True
+           >>> distanceVariable.setValue((1.5, 0.5, 0.5, -0.5))
+           >>> print numerix.allclose(distanceVariable._levelSetNormals, -answer)
+           True
         """
 
-        faceGrad = self.grad.arithmeticFaceValue
-        faceGradMag = numerix.array(faceGrad.mag)
-        faceGradMag = numerix.where(faceGradMag > 1e-10,
-                                    faceGradMag,
-                                    1e-10)
-        faceGrad = numerix.array(faceGrad)
-
-        ## set faceGrad zero on exteriorFaces
-        exteriorFaces = self.mesh.exteriorFaces
-        if len(exteriorFaces.value) > 0:
-            faceGrad[..., exteriorFaces.value] = 0.
-        
-        return faceGrad / faceGradMag 
+        if not hasattr(self, '_levelSetNormalsVariable'):
+            from fipy.variables.levelSetNormalsVariable import _LevelSetNormalsVariable
+            self._levelSetNormalsVariable = _LevelSetNormalsVariable(self)
+            
+        return self._levelSetNormalsVariable.value
 
 def _test(): 
     import fipy.tests.doctestPlus
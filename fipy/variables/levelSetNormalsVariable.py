@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ # 
+ #  FILE: "levelSetNormalsVariable.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #  
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ # 
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  
+ # ###################################################################
+ ##
+
+
+__docformat__ = 'restructuredtext'
+
+from fipy.variables.faceVariable import FaceVariable
+from fipy.tools import numerix
+
+class _LevelSetNormalsVariable(FaceVariable):
+    def __init__(self, distanceVar):
+        """
+        Creates a `_LevelSetNormalsVariable` object.
+
+        The face normals are only recalculated when `distanceVar` has
+        changed since they were last requested.
+
+        :Parameters:
+          - `distanceVar` : A `DistanceVariable` object.
+
+        """
+        FaceVariable.__init__(self, mesh=distanceVar.mesh, rank=1)
+        self.distanceVar = self._requires(distanceVar)
+
+    def _calcValue(self):
+        ## a view of the cached face gradient; it must not be modified
+        faceGrad = numerix.asarray(self.distanceVar.grad.arithmeticFaceValue)
+
+        ## accumulate the magnitude one contiguous component at a time
+        faceGradMag = faceGrad[0] * faceGrad[0]
+        for component in faceGrad[1:]:
+            faceGradMag += component * component
+        numerix.sqrt(faceGradMag, faceGradMag)
+        numerix.maximum(faceGradMag, 1e-10, faceGradMag)
+
+        normals = faceGrad / faceGradMag
+
+        ## set normals zero on exteriorFaces
+        exteriorFaces = self.mesh.exteriorFaces
+        if len(exteriorFaces.value) > 0:
+            normals[..., exteriorFaces.value] = 0.
+        
+        return normals
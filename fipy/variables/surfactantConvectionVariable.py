@@ -117,8 +117,8 @@ class SurfactantConvectionVariable(FaceVariable):
      
         faceNormalAreas = self.distanceVar._levelSetNormals * self.mesh._faceAreas
 
-        cellFaceNormalAreas = numerix.array(MA.filled(numerix.take(faceNormalAreas, cellFaceIDs, axis=-1), 0))
-        norms = numerix.array(MA.filled(MA.array(self.mesh._cellNormals), 0))
+        cellFaceNormalAreas = numerix.asarray(MA.filled(numerix.take(faceNormalAreas, cellFaceIDs, axis=-1), 0))
+        norms = numerix.asarray(MA.filled(MA.array(self.mesh._cellNormals), 0))
         
         alpha = numerix.dot(cellFaceNormalAreas, norms)
         alpha = numerix.where(alpha > 0, alpha, 0)
@@ -130,7 +130,7 @@ class SurfactantConvectionVariable(FaceVariable):
         phi = numerix.repeat(self.distanceVar[numerix.newaxis, ...], M, axis=0)
         alpha = numerix.where(phi > 0., 0, alpha)
         
-        volumes = numerix.array(self.mesh.cellVolumes)
+        volumes = numerix.asarray(self.mesh.cellVolumes)
         alpha = alpha * volumes * norms
 
         value = numerix.zeros((dim, Nfaces),'d')